@@ -0,0 +1,21 @@
+"""Poetry build script: optionally compile the affiliation classifier with mypyc.
+
+Set ``MYPYC=1`` to build ``pubmed_paper_fetcher/_parse.py`` as a C extension.
+mypy and setuptools must be installed in the build environment, e.g.
+``MYPYC=1 pip install --no-build-isolation .``. Without it the package is
+built as pure Python.
+"""
+import os
+from typing import Any, Dict
+
+MYPYC_MODULES = ["pubmed_paper_fetcher/_parse.py"]
+
+
+def build(setup_kwargs: Dict[str, Any]) -> None:
+    """Add the mypyc extension modules to the generated setup() call."""
+    if os.environ.get("MYPYC") != "1":
+        return
+
+    from mypyc.build import mypycify
+
+    setup_kwargs["ext_modules"] = mypycify(MYPYC_MODULES, opt_level="3")
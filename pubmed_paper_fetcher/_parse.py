@@ -0,0 +1,195 @@
+"""Affiliation classification used by the PubMed article parser.
+
+This module is kept fully annotated and free of dynamic features so that
+mypyc can compile it. Building the package with ``MYPYC=1`` does so (see
+build.py); otherwise it ships and runs as pure Python.
+"""
+import functools
+import re
+import string
+from typing import FrozenSet, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is an optional speedup
+    ahocorasick = None
+
+# (email, is_non_academic, company_name) for one affiliation.
+Classification = Tuple[Optional[str], bool, Optional[str]]
+
+_ACADEMIC = "ACAD"
+_COMPANY = "COMP"
+
+
+def _build_keyword_automaton(
+    academic_keywords: FrozenSet[str], company_keywords: FrozenSet[str]
+) -> Optional["ahocorasick.Automaton"]:
+    """
+    Build an Aho-Corasick automaton labelling each keyword with its category.
+
+    Args:
+        academic_keywords: Lower-case academic keywords
+        company_keywords: Lower-case company keywords
+
+    Returns:
+        Automaton whose values are (category, keyword_length), or None when
+        pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in academic_keywords:
+        automaton.add_word(keyword, (_ACADEMIC, len(keyword)))
+    for keyword in company_keywords:
+        automaton.add_word(keyword, (_COMPANY, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+
+ACADEMIC_KEYWORDS = frozenset(
+    {
+        "university",
+        "college",
+        "institute",
+        "school",
+        "academy",
+        "academia",
+        "hospital",
+        "clinic",
+        "medical center",
+        "health center",
+        "faculty",
+    }
+)
+
+COMPANY_KEYWORDS = frozenset(
+    {
+        "pharma",
+        "biotech",
+        "therapeutics",
+        "biosciences",
+        "laboratories",
+        "inc",
+        "corp",
+        "llc",
+        "ltd",
+        "co",
+        "company",
+        "gmbh",
+        "ag",
+        "sa",
+    }
+)
+
+EMAIL_PATTERN = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+
+# Maps A-Z to a-z and leaves every other character in place.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Single-pass, case-insensitive substring matchers for the keyword sets. The
+# keywords are ASCII; re.ASCII keeps IGNORECASE from folding non-ASCII letters
+# onto them ("ſ" -> "s", "İ" -> "i"), which the str.lower() matching never did.
+_ACADEMIC_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(ACADEMIC_KEYWORDS))), re.IGNORECASE | re.ASCII
+)
+_COMPANY_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(COMPANY_KEYWORDS))), re.IGNORECASE | re.ASCII
+)
+
+# Both keyword sets in one automaton, used when pyahocorasick is available.
+_KEYWORD_AUTOMATON = _build_keyword_automaton(ACADEMIC_KEYWORDS, COMPANY_KEYWORDS)
+
+
+def _match_keywords(
+    automaton: "ahocorasick.Automaton", affiliation: str, affiliation_lower: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Classify an affiliation with a single pass of the keyword automaton.
+
+    Args:
+        automaton: Automaton built by _build_keyword_automaton
+        affiliation: Affiliation text
+        affiliation_lower: Lower-cased affiliation with the same offsets
+
+    Returns:
+        Tuple of (is_non_academic, company_name)
+    """
+    company_start = -1
+    for end, (category, length) in automaton.iter(affiliation_lower):
+        if category == _ACADEMIC:
+            return False, None
+        start = end - length + 1
+        if company_start < 0 or start < company_start:
+            company_start = start
+
+    if company_start < 0:
+        return False, None
+
+    # The company name is the comma-delimited clause holding the first hit.
+    clause_start = affiliation.rfind(",", 0, company_start) + 1
+    clause_end = affiliation.find(",", company_start)
+    if clause_end < 0:
+        clause_end = len(affiliation)
+    return True, affiliation[clause_start:clause_end].strip()
+
+
+def _ascii_lower(text: str) -> str:
+    """
+    Lower-case only the ASCII letters of a string.
+
+    The keywords are ASCII, so this is all matching needs. Unlike a full
+    str.lower() it never changes the string's length (e.g. "İ" -> "i̇"), so
+    match offsets can be used to slice the original text.
+    """
+    if text.isascii():
+        return text.lower()
+    return text.translate(_ASCII_LOWER)
+
+
+def _classify_keywords(affiliation: str) -> Tuple[bool, Optional[str]]:
+    """
+    Classify a non-empty affiliation as academic or not by its keywords.
+
+    Args:
+        affiliation: Affiliation text
+
+    Returns:
+        Tuple of (is_non_academic, company_name)
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        return _match_keywords(
+            _KEYWORD_AUTOMATON, affiliation, _ascii_lower(affiliation)
+        )
+
+    if _ACADEMIC_PATTERN.search(affiliation):
+        return False, None
+
+    company_search = _COMPANY_PATTERN.search
+    if company_search(affiliation):
+        for word in affiliation.split(","):
+            word = word.strip()
+            if company_search(word):
+                return True, word
+        return True, affiliation
+
+    return False, None
+
+
+@functools.lru_cache(maxsize=8192)
+def classify(affiliation: str) -> Classification:
+    """
+    Extract the email from and classify a non-empty affiliation in one call.
+
+    Results are memoised across authors and papers.
+
+    Args:
+        affiliation: Affiliation text
+
+    Returns:
+        Tuple of (email, is_non_academic, company_name)
+    """
+    email_match = EMAIL_PATTERN.search(affiliation)
+    email = email_match.group(0) if email_match else None
+    is_non_academic, company = _classify_keywords(affiliation)
+    return email, is_non_academic, company
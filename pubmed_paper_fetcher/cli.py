@@ -32,7 +32,8 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "-f",
         "--file",
-        help="Output file path (CSV format). If not provided, prints to console.",
+        help="Output file path (CSV format). If not provided, prints tab-separated "
+        "rows to the console.",
     )
 
     parser.add_argument(
@@ -43,6 +44,26 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         help="Maximum number of results to fetch",
     )
 
+    parser.add_argument(
+        "-k",
+        "--api-key",
+        help="NCBI API key (raises the request rate limit from 3/s to 10/s)",
+    )
+
+    parser.add_argument(
+        "--pyarrow",
+        action="store_true",
+        help="Write the --file output with PyArrow's CSV writer, which quotes "
+        "every field (requires pyarrow)",
+    )
+
+    parser.add_argument(
+        "--medline",
+        action="store_true",
+        help="Fetch records as MEDLINE text instead of XML (smaller and faster "
+        "to parse, but without corresponding-author emails)",
+    )
+
     return parser.parse_args(args)
 
 
@@ -67,27 +88,31 @@ def main(args: Optional[List[str]] = None) -> int:
 
     try:
         # Initialize fetcher
-        fetcher = PubMedFetcher(debug=parsed_args.debug)
+        fetcher = PubMedFetcher(
+            debug=parsed_args.debug,
+            api_key=parsed_args.api_key,
+            medline=parsed_args.medline,
+        )
 
         # Fetch and process papers
         logger.info(f"Fetching papers for query: {parsed_args.query}")
-        df = fetcher.fetch_and_process(
+        papers = fetcher.fetch_papers(
             parsed_args.query, max_results=parsed_args.max_results
         )
 
         # Output results
-        if df.empty:
+        if not papers:
             logger.info("No papers found with non-academic authors")
             return 0
 
         if parsed_args.file:
-            df.to_csv(parsed_args.file, index=False)
+            fetcher.write_csv(papers, parsed_args.file, use_pyarrow=parsed_args.pyarrow)
             logger.info(f"Results saved to {parsed_args.file}")
         else:
-            # Print to console
-            print(df.to_string(index=False))
+            # Stream tab-separated rows to the console
+            fetcher.papers_to_csv(papers, sys.stdout, delimiter="\t")
 
-        logger.info(f"Found {len(df)} papers with non-academic authors")
+        logger.info(f"Found {len(papers)} papers with non-academic authors")
         return 0
 
     except Exception as e:
@@ -1,10 +1,51 @@
 """Core functionality for fetching and processing PubMed papers."""
+import csv
 import logging
-import re
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set, Tuple
+from io import BytesIO
+from itertools import islice
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
 import pandas as pd
-from Bio import Entrez
+import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import __version__
+from ._parse import (
+    ACADEMIC_KEYWORDS,
+    COMPANY_KEYWORDS,
+    EMAIL_PATTERN,
+    Classification,
+    classify,
+)
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional speedup
+    from json import loads as json_loads  # type: ignore[assignment]
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is an optional speedup
+    pa = None
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -12,9 +53,85 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-Entrez.email = "sriworkshere@gmail.com"  
+EMAIL = "sriworkshere@gmail.com"
+TOOL = "pubmed_paper_fetcher"
+
+EUTILS_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+REQUEST_TIMEOUT = 60
+
+# Shared keep-alive session for all E-utilities calls. Transient server errors
+# are retried with exponential backoff; both esearch and efetch are idempotent,
+# so POST is retried too. NCBI's 429 rate-limit responses are not retried here:
+# these retries bypass the rate limiter, so PubMedFetcher._request retries them.
+SESSION = requests.Session()
+SESSION.headers.update(
+    {
+        "Accept-Encoding": "gzip, deflate",
+        "User-Agent": f"{TOOL}/{__version__} ({EMAIL})",
+    }
+)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "POST"}),
+        )
+    ),
+)
+
+# Output columns, in order.
+COLUMNS = [
+    "PubmedID",
+    "Title",
+    "Publication Date",
+    "Non-academic Author(s)",
+    "Company Affiliation(s)",
+    "Corresponding Author Email",
+]
+
+# Write buffer for CSV output files.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Number of PMIDs requested per efetch call.
+EFETCH_CHUNK_SIZE = 200
+
+# Downloaded-but-unparsed chunks allowed in flight at once.
+MAX_PENDING_CHUNKS = 8
+
+# NCBI allows 3 requests/second without an API key and 10 with one.
+REQUESTS_PER_SECOND = 3
+REQUESTS_PER_SECOND_WITH_KEY = 10
+
+# Times a request rejected with 429 Too Many Requests is retried.
+RATE_LIMIT_RETRIES = 3
+
 
-@dataclass
+class _RateLimiter:
+    """Thread-safe limiter spacing calls at least ``1 / rate`` seconds apart."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller may issue its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# slots=True is only accepted on Python 3.10+.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class PaperAuthor:
     """Represents an author of a paper with their affiliation information."""
     name: str
@@ -24,13 +141,14 @@ class PaperAuthor:
     is_non_academic: bool = False
     company: Optional[str] = None
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class Paper:
     """Represents a research paper with its metadata."""
     pubmed_id: str
     title: str
     publication_date: str
     authors: List[PaperAuthor]
+    has_non_academic: bool = False
 
     @property
     def non_academic_authors(self) -> List[PaperAuthor]:
@@ -55,47 +173,60 @@ class Paper:
 
 class PubMedFetcher:
     """Fetches and processes papers from PubMed."""
-    ACADEMIC_KEYWORDS = {
-        "university",
-        "college",
-        "institute",
-        "school",
-        "academy",
-        "academia",
-        "hospital",
-        "clinic",
-        "medical center",
-        "health center",
-        "faculty",
-    }
+    __slots__ = ("debug", "api_key", "medline", "max_workers", "_rate_limiter")
 
-    
-    COMPANY_KEYWORDS = {
-        "pharma",
-        "biotech",
-        "therapeutics",
-        "biosciences",
-        "laboratories",
-        "inc",
-        "corp",
-        "llc",
-        "ltd",
-        "co",
-        "company",
-        "gmbh",
-        "ag",
-        "sa",
-    }
+    ACADEMIC_KEYWORDS = ACADEMIC_KEYWORDS
+    COMPANY_KEYWORDS = COMPANY_KEYWORDS
+    EMAIL_PATTERN = EMAIL_PATTERN
 
-    
-    EMAIL_PATTERN = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+    def __init__(
+        self, debug: bool = False, api_key: Optional[str] = None, medline: bool = False
+    ):
+        """
+        Initialize the fetcher.
 
-    def __init__(self, debug: bool = False):
-        """Initialize the fetcher with debug mode."""
+        Args:
+            debug: Enable debug logging
+            api_key: Optional NCBI API key, which raises the request rate limit
+            medline: Fetch records as MEDLINE text instead of XML. The payload
+                is about half the size and parses with a line scan, but it
+                carries no email identifiers or EqualContrib flags, so no
+                corresponding-author email is reported.
+        """
         self.debug = debug
+        self.api_key = api_key
+        self.medline = medline
+        self.max_workers = (
+            REQUESTS_PER_SECOND_WITH_KEY if api_key else REQUESTS_PER_SECOND
+        )
+        self._rate_limiter = _RateLimiter(self.max_workers)
         if debug:
             logger.setLevel(logging.DEBUG)
 
+    def _eutils_params(self, **params: Union[str, int]) -> Dict[str, Union[str, int]]:
+        """Add the identification parameters NCBI expects on every request."""
+        params["tool"] = TOOL
+        params["email"] = EMAIL
+        if self.api_key:
+            params["api_key"] = self.api_key
+        return params
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send an E-utilities request, retrying 429 responses.
+
+        Every attempt, including each retry, first waits for a rate limiter
+        slot, so a rejected request is never resent sooner than the limit
+        allows.
+        """
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self._rate_limiter.wait()
+            response = SESSION.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs)
+            if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                break
+            logger.debug(f"Rate limited by NCBI, retrying {url}")
+        response.raise_for_status()
+        return response
+
     def search_papers(self, query: str, max_results: int = 100) -> List[str]:
         """
         Search for papers matching the query.
@@ -109,16 +240,21 @@ class PubMedFetcher:
         """
         logger.debug(f"Searching PubMed with query: {query}")
         try:
-            handle = Entrez.esearch(db="pubmed", term=query, retmax=max_results)
-            record = Entrez.read(handle)
-            handle.close()
+            response = self._request(
+                "GET",
+                f"{EUTILS_URL}/esearch.fcgi",
+                params=self._eutils_params(
+                    db="pubmed", term=query, retmax=max_results, retmode="json"
+                ),
+            )
+            id_list = json_loads(response.content)["esearchresult"].get("idlist")
 
-            if "IdList" not in record or not record["IdList"]:
+            if not id_list:
                 logger.warning(f"No results found for query: {query}")
                 return []
 
-            logger.debug(f"Found {len(record['IdList'])} papers")
-            return record["IdList"]
+            logger.debug(f"Found {len(id_list)} papers")
+            return id_list
         except Exception as e:
             logger.error(f"Error searching PubMed: {e}")
             raise
@@ -137,16 +273,37 @@ class PubMedFetcher:
             return []
 
         logger.debug(f"Fetching details for {len(pubmed_ids)} papers")
+        chunks = [
+            pubmed_ids[i : i + EFETCH_CHUNK_SIZE]
+            for i in range(0, len(pubmed_ids), EFETCH_CHUNK_SIZE)
+        ]
         try:
-            handle = Entrez.efetch(db="pubmed", id=",".join(pubmed_ids), retmode="xml")
-            records = Entrez.read(handle)
-            handle.close()
-
             papers = []
-            for article in records["PubmedArticle"]:
-                paper = self._parse_article(article)
-                if paper and any(author.is_non_academic for author in paper.authors):
-                    papers.append(paper)
+            remaining = iter(chunks)
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(chunks))
+            ) as executor:
+                pending: Deque["Future[bytes]"] = deque(
+                    executor.submit(self._fetch_chunk, chunk)
+                    for chunk in islice(remaining, MAX_PENDING_CHUNKS)
+                )
+                try:
+                    while pending:
+                        body = pending.popleft().result()
+
+                        # Top the window up before parsing, so the next download
+                        # runs while this chunk is parsed and at most
+                        # MAX_PENDING_CHUNKS responses are held in memory.
+                        chunk = next(remaining, None)
+                        if chunk is not None:
+                            pending.append(executor.submit(self._fetch_chunk, chunk))
+
+                        papers.extend(self._parse_chunk(body))
+                except Exception:
+                    # Don't wait for queued downloads whose results are discarded.
+                    for future in pending:
+                        future.cancel()
+                    raise
 
             logger.debug(f"Processed {len(papers)} papers with non-academic authors")
             return papers
@@ -154,57 +311,213 @@ class PubMedFetcher:
             logger.error(f"Error fetching paper details: {e}")
             raise
 
-    def _parse_article(self, article: Dict[str, Any]) -> Optional[Paper]:
+    def _fetch_chunk(self, pubmed_ids: List[str]) -> bytes:
+        """Download the XML or MEDLINE records for one chunk of PubMed IDs."""
+        logger.debug(f"Requesting {len(pubmed_ids)} records from efetch")
+        if self.medline:
+            formats = {"rettype": "medline", "retmode": "text"}
+        else:
+            formats = {"retmode": "xml"}
+        response = self._request(
+            "POST",
+            f"{EUTILS_URL}/efetch.fcgi",
+            data=self._eutils_params(db="pubmed", id=",".join(pubmed_ids), **formats),
+        )
+        return response.content
+
+    def _parse_chunk(self, body: bytes) -> List[Paper]:
+        """Stream-parse one efetch response, keeping papers with non-academic authors."""
+        if self.medline:
+            return list(self._parse_medline(body.decode("utf-8")))
+
+        papers = []
+        for _, article in etree.iterparse(
+            BytesIO(body), events=("end",), tag="PubmedArticle", huge_tree=True
+        ):
+            paper = self._parse_article(article)
+
+            # Free the finished article so only one stays resident at a time.
+            article.clear()
+            while article.getprevious() is not None:
+                del article.getparent()[0]
+
+            if paper and paper.has_non_academic:
+                papers.append(paper)
+        return papers
+
+    def _parse_medline(self, text: str) -> Iterator[Paper]:
+        """
+        Parse MEDLINE text records, yielding papers with non-academic authors.
+
+        Records are separated by blank lines. Each line starts with a tag
+        padded to four characters and "- "; long values continue on lines
+        indented by six spaces.
+
+        Args:
+            text: efetch response in MEDLINE format
+
+        Yields:
+            Paper objects with at least one non-academic author
+        """
+        for record in text.split("\n\n"):
+            fields: List[Tuple[str, str]] = []
+            for line in record.splitlines():
+                if line.startswith("      ") and fields:
+                    tag, value = fields[-1]
+                    fields[-1] = (tag, f"{value} {line.strip()}")
+                elif line[4:6] == "- ":
+                    fields.append((line[:4].rstrip(), line[6:]))
+
+            paper = self._parse_medline_record(fields) if fields else None
+            if paper:
+                yield paper
+
+    def _parse_medline_record(self, fields: List[Tuple[str, str]]) -> Optional[Paper]:
+        """
+        Build a Paper from the (tag, value) fields of one MEDLINE record.
+
+        Args:
+            fields: Record fields in file order
+
+        Returns:
+            Paper object, or None if no author is non-academic or there is no PMID
+        """
+        pubmed_id = None
+        title = ""
+        pub_date = "Unknown"
+        # (name, affiliations) per author; AD lines follow their author.
+        author_fields: List[Tuple[str, List[str]]] = []
+
+        for tag, value in fields:
+            if tag == "PMID":
+                pubmed_id = value
+            elif tag == "TI":
+                title = value
+            elif tag == "DP":
+                pub_date = "-".join(value.split())
+            elif tag == "FAU" or tag == "CN":
+                author_fields.append((value, []))
+            elif tag == "AD" and author_fields:
+                author_fields[-1][1].append(value)
+
+        if pubmed_id is None:
+            return None
+
+        # Classify every author before allocating any PaperAuthor.
+        classifications: Dict[str, Classification] = {}
+        classified = []
+        has_non_academic = False
+        for name, affiliations in author_fields:
+            affiliation = "; ".join(affiliations) or None
+            classification = self._classify(affiliation, classifications)
+            has_non_academic = has_non_academic or classification[1]
+            classified.append((name, affiliation, classification))
+
+        if not has_non_academic:
+            return None
+
+        authors = [
+            PaperAuthor(
+                name=name,
+                affiliation=affiliation,
+                email=email,
+                is_non_academic=is_non_academic,
+                company=company,
+            )
+            for name, affiliation, (email, is_non_academic, company) in classified
+        ]
+        return Paper(
+            pubmed_id=pubmed_id,
+            title=title,
+            publication_date=pub_date,
+            authors=authors,
+            has_non_academic=True,
+        )
+
+    def _parse_article(self, article: etree._Element) -> Optional[Paper]:
         """
         Parse a PubMed article into a Paper object.
 
         Args:
-            article: PubMed article data
+            article: PubmedArticle XML element
 
         Returns:
-            Paper object or None if parsing fails
+            Paper object, or None if no author is non-academic or parsing fails
         """
         try:
-            article_data = article["MedlineCitation"]["Article"]
-            pubmed_id = article["MedlineCitation"]["PMID"]
+            pubmed_id = article.findtext("MedlineCitation/PMID")
+            article_data = article.find("MedlineCitation/Article")
+            if pubmed_id is None or article_data is None:
+                logger.warning("Missing MedlineCitation data in article")
+                return None
+
+            # Authors of one paper often share an affiliation string, so
+            # classifications are also memoised per paper.
+            classifications: Dict[str, Classification] = {}
+
+            # Most articles are discarded, so filter before materialising.
+            if not self._has_non_academic_author(article_data, classifications):
+                return None
 
             
-            title = article_data.get("ArticleTitle", "")
+            title_element = article_data.find("ArticleTitle")
+            title = (
+                etree.tostring(
+                    title_element, method="text", encoding="unicode", with_tail=False
+                )
+                if title_element is not None
+                else ""
+            )
 
             
             pub_date = self._extract_publication_date(article_data)
 
             
-            authors = self._extract_authors(article_data)
+            authors, has_non_academic = self._extract_authors(
+                article_data, classifications
+            )
 
             return Paper(
                 pubmed_id=pubmed_id,
                 title=title,
                 publication_date=pub_date,
                 authors=authors,
+                has_non_academic=has_non_academic,
             )
-        except KeyError as e:
-            logger.warning(f"Missing key in article data: {e}")
-            return None
         except Exception as e:
             logger.warning(
                 f"Error parsing article {pubmed_id if 'pubmed_id' in locals() else 'unknown'}: {e}"
             )
             return None
 
-    def _extract_publication_date(self, article_data: Dict[str, Any]) -> str:
+    def _has_non_academic_author(
+        self,
+        article_data: etree._Element,
+        classifications: Optional[Dict[str, Classification]] = None,
+    ) -> bool:
+        """Check whether any named author has a non-academic affiliation."""
+        for author_data in article_data.iterfind("AuthorList/Author"):
+            if (
+                author_data.find("LastName") is None
+                and author_data.find("CollectiveName") is None
+            ):
+                continue
+            affiliation = self._extract_affiliation(author_data)
+            if self._classify(affiliation, classifications)[1]:
+                return True
+        return False
+
+    def _extract_publication_date(self, article_data: etree._Element) -> str:
         """Extract publication date from article data."""
         try:
-            if "PubDate" in article_data.get("Journal", {}).get("JournalIssue", {}).get(
-                "PubDate", {}
-            ):
-                pub_date = article_data["Journal"]["JournalIssue"]["PubDate"]
+            pub_date = article_data.find("Journal/JournalIssue/PubDate")
+            if pub_date is not None:
+                year = pub_date.findtext("Year")
 
                 
-                if "Year" in pub_date:
-                    year = pub_date.get("Year", "")
-                    month = pub_date.get("Month", "")
-                    day = pub_date.get("Day", "")
+                if year:
+                    month = pub_date.findtext("Month", "")
+                    day = pub_date.findtext("Day", "")
 
                     if month and day:
                         return f"{year}-{month}-{day}"
@@ -212,15 +525,16 @@ class PubMedFetcher:
                         return f"{year}-{month}"
                     else:
                         return year
-                elif "MedlineDate" in pub_date:
-                    return pub_date["MedlineDate"]
+                medline_date = pub_date.findtext("MedlineDate")
+                if medline_date:
+                    return medline_date
 
             
-            if "ArticleDate" in article_data and article_data["ArticleDate"]:
-                article_date = article_data["ArticleDate"][0]
-                year = article_date.get("Year", "")
-                month = article_date.get("Month", "")
-                day = article_date.get("Day", "")
+            article_date = article_data.find("ArticleDate")
+            if article_date is not None:
+                year = article_date.findtext("Year", "")
+                month = article_date.findtext("Month", "")
+                day = article_date.findtext("Day", "")
                 return f"{year}-{month}-{day}"
 
             return "Unknown"
@@ -228,38 +542,45 @@ class PubMedFetcher:
             logger.warning(f"Error extracting publication date: {e}")
             return "Unknown"
 
-    def _extract_authors(self, article_data: Dict[str, Any]) -> List[PaperAuthor]:
-        """Extract authors and their affiliations from article data."""
-        authors:list[PaperAuthor]=[]
+    def _extract_authors(
+        self,
+        article_data: etree._Element,
+        classifications: Optional[Dict[str, Classification]] = None,
+    ) -> Tuple[List[PaperAuthor], bool]:
+        """
+        Extract authors and their affiliations from article data.
 
-        if "AuthorList" not in article_data:
-            return authors
+        Returns:
+            Tuple of (authors, whether any author is non-academic)
+        """
+        authors:list[PaperAuthor]=[]
+        has_non_academic = False
 
-        for author_data in article_data["AuthorList"]:
-            if "LastName" not in author_data and "CollectiveName" not in author_data:
-                continue
+        for author_data in article_data.iterfind("AuthorList/Author"):
+            collective_name = author_data.findtext("CollectiveName")
+            last_name = author_data.findtext("LastName")
 
             
-            if "CollectiveName" in author_data:
-                name = author_data["CollectiveName"]
-            else:
-                last_name = author_data.get("LastName", "")
-                fore_name = author_data.get("ForeName", "")
+            if collective_name is not None:
+                name = collective_name
+            elif last_name is not None:
+                fore_name = author_data.findtext("ForeName", "")
                 name = f"{last_name}, {fore_name}" if fore_name else last_name
+            else:
+                continue
 
             
             affiliation = self._extract_affiliation(author_data)
 
             
-            email = self._extract_email(author_data, affiliation)
-
-            
-            is_corresponding = False
-            if "EqualContrib" in author_data and author_data["EqualContrib"] == "Y":
-                is_corresponding = True
+            affiliation_email, is_non_academic, company = self._classify(
+                affiliation, classifications
+            )
+            email = self._extract_email(author_data) or affiliation_email
+            has_non_academic = has_non_academic or is_non_academic
 
             
-            is_non_academic, company = self._check_non_academic(affiliation)
+            is_corresponding = author_data.get("EqualContrib") == "Y"
 
             authors.append(
                 PaperAuthor(
@@ -272,35 +593,50 @@ class PubMedFetcher:
                 )
             )
 
-        return authors
+        return authors, has_non_academic
 
-    def _extract_affiliation(self, author_data: Dict[str, Any]) -> Optional[str]:
+    def _extract_affiliation(self, author_data: etree._Element) -> Optional[str]:
         """Extract affiliation from author data."""
-        if "AffiliationInfo" in author_data:
-            affiliations = []
-            for affiliation_info in author_data["AffiliationInfo"]:
-                if "Affiliation" in affiliation_info:
-                    affiliations.append(affiliation_info["Affiliation"])
-            return "; ".join(affiliations) if affiliations else None
+        affiliations = [
+            affiliation.text
+            for affiliation in author_data.iterfind("AffiliationInfo/Affiliation")
+            if affiliation.text
+        ]
+        return "; ".join(affiliations) if affiliations else None
+
+    def _extract_email(self, author_data: etree._Element) -> Optional[str]:
+        """Extract an email identifier from author data."""
+        for identifier in author_data.iterfind("Identifier"):
+            if identifier.get("Source") == "Email" and identifier.text:
+                return identifier.text
         return None
 
-    def _extract_email(
-        self, author_data: Dict[str, Any], affiliation: Optional[str]
-    ) -> Optional[str]:
-        """Extract email from author data or affiliation text."""
-        
-        if "Identifier" in author_data:
-            for identifier in author_data["Identifier"]:
-                if identifier.attributes.get("Source") == "Email":
-                    return identifier
+    def _classify(
+        self,
+        affiliation: Optional[str],
+        classifications: Optional[Dict[str, Classification]] = None,
+    ) -> Classification:
+        """
+        Extract the email and non-academic status from an affiliation.
 
-        
-        if affiliation:
-            email_match = self.EMAIL_PATTERN.search(affiliation)
-            if email_match:
-                return email_match.group(0)
+        Args:
+            affiliation: Affiliation text
+            classifications: Optional per-paper cache of earlier results. A
+                plain dict hit skips building the shared lru_cache's key and
+                moving its LRU entry
 
-        return None
+        Returns:
+            Tuple of (email, is_non_academic, company_name)
+        """
+        if not affiliation:
+            return None, False, None
+        if classifications is None:
+            return classify(affiliation)
+
+        result = classifications.get(affiliation)
+        if result is None:
+            result = classifications[affiliation] = classify(affiliation)
+        return result
 
     def _check_non_academic(
         self, affiliation: Optional[str]
@@ -314,30 +650,110 @@ class PubMedFetcher:
         Returns:
             Tuple of (is_non_academic, company_name)
         """
-        if not affiliation:
-            return False, None
-
-        affiliation_lower = affiliation.lower()
+        _, is_non_academic, company = self._classify(affiliation)
+        return is_non_academic, company
+
+    def _paper_row(self, paper: Paper) -> Tuple[str, str, str, str, str, str]:
+        """Flatten a paper into one output row, in COLUMNS order."""
+        # One walk over the authors instead of one per Paper property.
+        names = []
+        companies: Dict[str, None] = {}
+        email = None
+        for author in paper.authors:
+            if author.is_non_academic:
+                names.append(author.name)
+                if author.company:
+                    companies[author.company] = None
+            if email is None and author.is_corresponding and author.email:
+                email = author.email
+
+        return (
+            paper.pubmed_id,
+            paper.title,
+            paper.publication_date,
+            ", ".join(names),
+            ", ".join(companies),
+            email or "",
+        )
+
+    def papers_to_csv(
+        self, papers: List[Paper], fileobj: TextIO, delimiter: str = ","
+    ) -> None:
+        """
+        Write papers as CSV rows, without building a DataFrame.
 
-        
-        for keyword in self.ACADEMIC_KEYWORDS:
-            if keyword in affiliation_lower:
-                return False, None
+        Args:
+            papers: List of Paper objects
+            fileobj: Text file opened with newline=""
+            delimiter: Field separator
+        """
+        writer = csv.writer(fileobj, delimiter=delimiter, lineterminator="\n")
+        writer.writerow(COLUMNS)
+        writer.writerows(map(self._paper_row, papers))
 
-        
-        for keyword in self.COMPANY_KEYWORDS:
-            if keyword in affiliation_lower:
-                
-                words = affiliation.split(",")
-                for word in words:
-                    word = word.strip()
-                    if any(kw in word.lower() for kw in self.COMPANY_KEYWORDS):
-                        return True, word
+    def write_csv(
+        self, papers: List[Paper], path: str, use_pyarrow: bool = False
+    ) -> None:
+        """
+        Write papers to a CSV file.
 
-                
-                return True, affiliation
+        Args:
+            papers: List of Paper objects
+            path: Output file path
+            use_pyarrow: Write with PyArrow's CSV writer, which quotes every
+                field; requires pyarrow to be installed
+        """
+        if use_pyarrow:
+            if pa is None:
+                raise ImportError(
+                    "PyArrow output requested but pyarrow is not installed "
+                    "(install the 'speedups' extra)"
+                )
+            table = pa.table(
+                {
+                    name: pa.array(values, type=pa.string())
+                    for name, values in self._paper_columns(papers).items()
+                }
+            )
+            pa_csv.write_csv(table, path)
+            return
+
+        with open(
+            path, "w", buffering=OUTPUT_BUFFER_SIZE, encoding="utf-8", newline=""
+        ) as fileobj:
+            self.papers_to_csv(papers, fileobj)
+
+    def _paper_columns(self, papers: List[Paper]) -> Dict[str, List[str]]:
+        """Build the output columns for papers, keyed by COLUMNS name."""
+        pmids: List[str] = []
+        titles: List[str] = []
+        dates: List[str] = []
+        non_academic_authors: List[str] = []
+        company_affiliations: List[str] = []
+        emails: List[str] = []
 
-        return False, None
+        for paper in papers:
+            pmid, title, date, names, companies, email = self._paper_row(paper)
+            pmids.append(pmid)
+            titles.append(title)
+            dates.append(date)
+            non_academic_authors.append(names)
+            company_affiliations.append(companies)
+            emails.append(email)
+
+        return dict(
+            zip(
+                COLUMNS,
+                (
+                    pmids,
+                    titles,
+                    dates,
+                    non_academic_authors,
+                    company_affiliations,
+                    emails,
+                ),
+            )
+        )
 
     def papers_to_dataframe(self, papers: List[Paper]) -> pd.DataFrame:
         """
@@ -349,37 +765,18 @@ class PubMedFetcher:
         Returns:
             DataFrame with paper information
         """
-        data = []
-        for paper in papers:
-            non_academic_authors = ", ".join(
-                [author.name for author in paper.non_academic_authors]
-            )
-            company_affiliations = ", ".join(paper.company_affiliations)
-
-            data.append(
-                {
-                    "PubmedID": paper.pubmed_id,
-                    "Title": paper.title,
-                    "Publication Date": paper.publication_date,
-                    "Non-academic Author(s)": non_academic_authors,
-                    "Company Affiliation(s)": company_affiliations,
-                    "Corresponding Author Email": paper.corresponding_author_email
-                    or "",
-                }
-            )
+        return pd.DataFrame(self._paper_columns(papers))
 
-        return pd.DataFrame(data)
-
-    def fetch_and_process(self, query: str, max_results: int = 100) -> pd.DataFrame:
+    def fetch_papers(self, query: str, max_results: int = 100) -> List[Paper]:
         """
-        Fetch and process papers based on the query.
+        Search for papers and fetch those with non-academic authors.
 
         Args:
             query: PubMed search query
             max_results: Maximum number of results to return
 
         Returns:
-            DataFrame with processed paper information
+            List of Paper objects with at least one non-academic author
         """
         logger.info(f"Fetching papers for query: {query}")
 
@@ -388,19 +785,25 @@ class PubMedFetcher:
 
         if not pubmed_ids:
             logger.info("No papers found")
-            return pd.DataFrame(
-                columns=[
-                    "PubmedID",
-                    "Title",
-                    "Publication Date",
-                    "Non-academic Author(s)",
-                    "Company Affiliation(s)",
-                    "Corresponding Author Email",
-                ]
-            )
+            return []
 
         
-        papers = self.fetch_paper_details(pubmed_ids)
+        return self.fetch_paper_details(pubmed_ids)
+
+    def fetch_and_process(self, query: str, max_results: int = 100) -> pd.DataFrame:
+        """
+        Fetch and process papers based on the query.
+
+        Args:
+            query: PubMed search query
+            max_results: Maximum number of results to return
+
+        Returns:
+            DataFrame with processed paper information
+        """
+        papers = self.fetch_papers(query, max_results)
+        if not papers:
+            return pd.DataFrame(columns=COLUMNS)
 
         
         df = self.papers_to_dataframe(papers)
@@ -0,0 +1,644 @@
+"""Tests for the PubMed paper fetcher."""
+
+import io
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from pubmed_paper_fetcher import _parse, cli, fetcher
+from pubmed_paper_fetcher.fetcher import COLUMNS, Paper, PaperAuthor, PubMedFetcher
+
+
+class FakeClock:
+    """Stands in for time.monotonic and time.sleep."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(fetcher.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(fetcher.time, "sleep", fake.sleep)
+    return fake
+
+
+def test_rate_limiter_spaces_calls(clock):
+    limiter = fetcher._RateLimiter(10)
+    for _ in range(3):
+        limiter.wait()
+    assert clock.sleeps == pytest.approx([0.1, 0.1])
+
+
+def test_rate_limiter_does_not_sleep_after_idle(clock):
+    limiter = fetcher._RateLimiter(10)
+    limiter.wait()
+    clock.now += 1
+    limiter.wait()
+    assert clock.sleeps == []
+
+
+def test_rate_limiter_is_shared_across_threads():
+    limiter = fetcher._RateLimiter(50)
+    threads = [threading.Thread(target=limiter.wait) for _ in range(6)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # The first call goes straight through; the other five are 20 ms apart.
+    assert time.monotonic() - start >= 0.09
+
+
+def test_rate_limit_follows_api_key():
+    assert PubMedFetcher().max_workers == fetcher.REQUESTS_PER_SECOND
+    assert (
+        PubMedFetcher(api_key="key").max_workers == fetcher.REQUESTS_PER_SECOND_WITH_KEY
+    )
+
+
+XML_ARTICLES = b"""<?xml version="1.0"?>
+<PubmedArticleSet>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID>222</PMID>
+      <Article>
+        <Journal><JournalIssue><PubDate>
+          <Year>2021</Year><Month>Feb</Month><Day>03</Day>
+        </PubDate></JournalIssue></Journal>
+        <ArticleTitle>Title with <i>markup</i></ArticleTitle>
+        <AuthorList>
+          <Author>
+            <LastName>Smith</LastName><ForeName>Jane</ForeName>
+            <AffiliationInfo>
+              <Affiliation>Harvard University, Boston.</Affiliation>
+            </AffiliationInfo>
+          </Author>
+          <Author EqualContrib="Y">
+            <LastName>Doe</LastName><ForeName>John</ForeName>
+            <Identifier Source="Email">john@pfizer.com</Identifier>
+            <AffiliationInfo>
+              <Affiliation>Pfizer Inc, New York.</Affiliation>
+            </AffiliationInfo>
+          </Author>
+          <Author>
+            <CollectiveName>Acme Therapeutics Consortium</CollectiveName>
+          </Author>
+        </AuthorList>
+      </Article>
+    </MedlineCitation>
+  </PubmedArticle>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID>444</PMID>
+      <Article>
+        <ArticleTitle>Academic only</ArticleTitle>
+        <AuthorList>
+          <Author>
+            <LastName>Lee</LastName>
+            <AffiliationInfo>
+              <Affiliation>University of Oxford.</Affiliation>
+            </AffiliationInfo>
+          </Author>
+        </AuthorList>
+      </Article>
+    </MedlineCitation>
+  </PubmedArticle>
+</PubmedArticleSet>
+"""
+
+
+def test_xml_articles():
+    papers = PubMedFetcher()._parse_chunk(XML_ARTICLES)
+
+    # The academic-only article is dropped.
+    assert [paper.pubmed_id for paper in papers] == ["222"]
+    paper = papers[0]
+    assert paper.title == "Title with markup"
+    assert paper.publication_date == "2021-Feb-03"
+    assert [author.name for author in paper.authors] == [
+        "Smith, Jane",
+        "Doe, John",
+        "Acme Therapeutics Consortium",
+    ]
+    assert [author.name for author in paper.non_academic_authors] == ["Doe, John"]
+    assert paper.company_affiliations == {"Pfizer Inc"}
+    assert paper.corresponding_author_email == "john@pfizer.com"
+
+
+def test_xml_articles_without_pmid_are_skipped():
+    body = (
+        b"<PubmedArticleSet><PubmedArticle><MedlineCitation/></PubmedArticle>"
+        b"</PubmedArticleSet>"
+    )
+    assert PubMedFetcher()._parse_chunk(body) == []
+
+
+AFFILIATIONS = [
+    "Dept X, Novartis AG, Basel",
+    "Pfizer Inc; Harvard University",
+    "Department of Biology, Harvard University, Boston.",
+    "Novartis AG, Basel. jane@novartis.com",
+    "Genentech, South San Francisco",
+    "Roche Diagnostics GmbH, Penzberg, Germany",
+    "Independent researcher",
+    "İstanbul Pharma Co",
+    "DİVİZYON İLAÇ İŞLERİ, Acme Co, Ankara",
+    "ſa",
+    "İnc, Pfizer Inc, New York",
+]
+
+
+@pytest.fixture(params=["automaton", "regex"])
+def keyword_mode(request, monkeypatch):
+    """Run a test with the Aho-Corasick automaton and with the regex fallback."""
+    if request.param == "automaton":
+        if _parse._KEYWORD_AUTOMATON is None:
+            pytest.skip("pyahocorasick is not installed")
+    else:
+        monkeypatch.setattr(_parse, "_KEYWORD_AUTOMATON", None)
+    _parse.classify.cache_clear()
+    yield request.param
+    _parse.classify.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "affiliation, company",
+    [
+        ("Dept X, Novartis AG, Basel", "Novartis AG"),
+        ("Roche Diagnostics GmbH, Penzberg, Germany", "Roche Diagnostics GmbH"),
+        ("Acme Therapeutics", "Acme Therapeutics"),
+        # Non-ASCII letters never case-fold onto the ASCII keywords.
+        ("İnc, Pfizer Inc, New York", "Pfizer Inc"),
+    ],
+)
+def test_classify_company_clause(keyword_mode, affiliation, company):
+    assert _parse.classify(affiliation) == (None, True, company)
+
+
+@pytest.mark.parametrize(
+    "affiliation",
+    ["Pfizer Inc; Harvard University", "Mayo Clinic", "Independent researcher", "ſa"],
+)
+def test_classify_academic_or_unknown(keyword_mode, affiliation):
+    assert _parse.classify(affiliation) == (None, False, None)
+
+
+def test_automaton_matches_regex_fallback(monkeypatch):
+    if _parse._KEYWORD_AUTOMATON is None:
+        pytest.skip("pyahocorasick is not installed")
+
+    _parse.classify.cache_clear()
+    with_automaton = [_parse.classify(affiliation) for affiliation in AFFILIATIONS]
+
+    monkeypatch.setattr(_parse, "_KEYWORD_AUTOMATON", None)
+    _parse.classify.cache_clear()
+    with_regex = [_parse.classify(affiliation) for affiliation in AFFILIATIONS]
+    _parse.classify.cache_clear()
+
+    assert with_automaton == with_regex
+
+
+def _sample_papers():
+    return [
+        Paper(
+            pubmed_id="1",
+            title='Commas, and "quotes"',
+            publication_date="2020-Jan-02",
+            authors=[
+                PaperAuthor(name="Smith, Jane", affiliation="Harvard University"),
+                PaperAuthor(
+                    name="Doe, John",
+                    email="john@pfizer.com",
+                    is_corresponding=True,
+                    is_non_academic=True,
+                    company="Pfizer Inc",
+                ),
+                PaperAuthor(
+                    name="Roe, Ann", is_non_academic=True, company="Pfizer Inc"
+                ),
+            ],
+            has_non_academic=True,
+        ),
+        Paper(
+            pubmed_id="2",
+            title="Plain",
+            publication_date="2021",
+            authors=[
+                PaperAuthor(name="Lee, Kim", is_non_academic=True, company="Acme Co"),
+            ],
+            has_non_academic=True,
+        ),
+    ]
+
+
+def test_papers_to_dataframe():
+    frame = PubMedFetcher().papers_to_dataframe(_sample_papers())
+    assert list(frame.columns) == COLUMNS
+    assert frame.to_dict("list") == {
+        "PubmedID": ["1", "2"],
+        "Title": ['Commas, and "quotes"', "Plain"],
+        "Publication Date": ["2020-Jan-02", "2021"],
+        "Non-academic Author(s)": ["Doe, John, Roe, Ann", "Lee, Kim"],
+        # Companies are de-duplicated in first-seen order.
+        "Company Affiliation(s)": ["Pfizer Inc", "Acme Co"],
+        "Corresponding Author Email": ["john@pfizer.com", ""],
+    }
+
+
+def test_papers_to_dataframe_empty():
+    frame = PubMedFetcher().papers_to_dataframe([])
+    assert list(frame.columns) == COLUMNS
+    assert frame.empty
+
+
+EXPECTED_CSV = (
+    ",".join(COLUMNS) + "\n"
+    '1,"Commas, and ""quotes""",2020-Jan-02,"Doe, John, Roe, Ann",Pfizer Inc,'
+    "john@pfizer.com\n"
+    '2,Plain,2021,"Lee, Kim",Acme Co,\n'
+)
+
+
+def test_papers_to_csv():
+    output = io.StringIO()
+    PubMedFetcher().papers_to_csv(_sample_papers(), output)
+    assert output.getvalue() == EXPECTED_CSV
+
+
+def test_papers_to_csv_matches_pandas():
+    papers = _sample_papers()
+    output = io.StringIO()
+    PubMedFetcher().papers_to_csv(papers, output)
+    expected = PubMedFetcher().papers_to_dataframe(papers).to_csv(index=False)
+    assert output.getvalue() == expected
+
+
+def test_write_csv(tmp_path):
+    path = tmp_path / "papers.csv"
+    PubMedFetcher().write_csv(_sample_papers(), str(path))
+    assert path.read_text(encoding="utf-8") == EXPECTED_CSV
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, content, status_code=200):
+        self.content = content
+        self.status_code = status_code
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error", response=self)
+
+
+@pytest.fixture
+def no_rate_limit(monkeypatch):
+    monkeypatch.setattr(fetcher._RateLimiter, "wait", lambda self: None)
+
+
+class FakeSession:
+    """Records E-utilities requests and answers them from a handler."""
+
+    def __init__(self):
+        self.sent = []
+        self.lock = threading.Lock()
+        self.handler = None
+
+    def request(self, method, url, **kwargs):
+        with self.lock:
+            self.sent.append((method, url, kwargs))
+        return self.handler(method, url, **kwargs)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = FakeSession()
+    monkeypatch.setattr(fetcher.SESSION, "request", fake.request)
+    return fake
+
+
+def test_search_papers(session, no_rate_limit):
+    session.handler = lambda method, url, **kwargs: FakeResponse(
+        b'{"header": {}, "esearchresult": {"count": "2", "idlist": ["11", "22"]}}'
+    )
+    assert PubMedFetcher(api_key="key").search_papers("cancer", 5) == ["11", "22"]
+
+    ((method, url, kwargs),) = session.sent
+    assert method == "GET"
+    assert url.endswith("/esearch.fcgi")
+    assert kwargs["params"] == {
+        "db": "pubmed",
+        "term": "cancer",
+        "retmax": 5,
+        "retmode": "json",
+        "tool": fetcher.TOOL,
+        "email": fetcher.EMAIL,
+        "api_key": "key",
+    }
+
+
+def test_search_papers_without_results(session, no_rate_limit):
+    session.handler = lambda method, url, **kwargs: FakeResponse(
+        b'{"esearchresult": {"count": "0", "idlist": []}}'
+    )
+    assert PubMedFetcher().search_papers("nothing") == []
+
+
+def test_search_papers_http_error(session, no_rate_limit):
+    session.handler = lambda method, url, **kwargs: FakeResponse(b"", 500)
+    with pytest.raises(requests.HTTPError):
+        PubMedFetcher().search_papers("cancer")
+
+
+def test_rate_limited_request_waits_for_limiter(session, clock):
+    responses = iter([FakeResponse(b"", 429), FakeResponse(b"<PubmedArticleSet/>")])
+    session.handler = lambda method, url, **kwargs: next(responses)
+
+    assert PubMedFetcher()._fetch_chunk(["1"]) == b"<PubmedArticleSet/>"
+    assert len(session.sent) == 2
+    # The retry is spaced by the limiter, not resent immediately.
+    assert clock.sleeps == pytest.approx([1 / fetcher.REQUESTS_PER_SECOND])
+
+
+def test_rate_limited_request_gives_up(session, no_rate_limit):
+    session.handler = lambda method, url, **kwargs: FakeResponse(b"", 429)
+    with pytest.raises(requests.HTTPError):
+        PubMedFetcher().search_papers("cancer")
+    assert len(session.sent) == fetcher.RATE_LIMIT_RETRIES + 1
+
+
+def test_classify_extracts_email(keyword_mode):
+    assert _parse.classify("Novartis AG, Basel. jane@novartis.com") == (
+        "jane@novartis.com",
+        True,
+        "Novartis AG",
+    )
+
+
+def test_xml_email_falls_back_to_affiliation():
+    body = b"""<PubmedArticleSet><PubmedArticle><MedlineCitation>
+      <PMID>7</PMID>
+      <Article><ArticleTitle>T</ArticleTitle><AuthorList>
+        <Author EqualContrib="Y"><LastName>Doe</LastName>
+          <AffiliationInfo>
+            <Affiliation>Pfizer Inc, New York. doe@pfizer.com</Affiliation>
+          </AffiliationInfo>
+        </Author>
+      </AuthorList></Article>
+    </MedlineCitation></PubmedArticle></PubmedArticleSet>"""
+    (paper,) = PubMedFetcher()._parse_chunk(body)
+    assert paper.corresponding_author_email == "doe@pfizer.com"
+    assert paper.authors[0].company == "Pfizer Inc"
+
+
+def _efetch_article(pubmed_id):
+    return (
+        "<PubmedArticleSet><PubmedArticle><MedlineCitation>"
+        f"<PMID>{pubmed_id}</PMID><Article><AuthorList><Author>"
+        "<LastName>Doe</LastName><AffiliationInfo>"
+        "<Affiliation>Pfizer Inc</Affiliation></AffiliationInfo>"
+        "</Author></AuthorList></Article>"
+        "</MedlineCitation></PubmedArticle></PubmedArticleSet>"
+    ).encode()
+
+
+@pytest.fixture
+def submitted(monkeypatch):
+    """Record every future submitted to the fetcher's thread pool."""
+    futures = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, *args, **kwargs):
+            future = super().submit(*args, **kwargs)
+            futures.append(future)
+            return future
+
+    monkeypatch.setattr(fetcher, "ThreadPoolExecutor", RecordingExecutor)
+    return futures
+
+
+def test_fetch_paper_details_chunks_in_order(session, no_rate_limit):
+    chunk_count = 21
+    pubmed_ids = [str(i) for i in range(fetcher.EFETCH_CHUNK_SIZE * 20 + 1)]
+
+    def handler(method, url, data, **kwargs):
+        ids = data["id"].split(",")
+        # Later chunks finish first, so results arrive out of order.
+        index = int(ids[0]) // fetcher.EFETCH_CHUNK_SIZE
+        time.sleep(0.002 * (chunk_count - index))
+        return FakeResponse(_efetch_article(ids[0]))
+
+    session.handler = handler
+    papers = PubMedFetcher().fetch_paper_details(pubmed_ids)
+
+    assert [paper.pubmed_id for paper in papers] == pubmed_ids[
+        :: fetcher.EFETCH_CHUNK_SIZE
+    ]
+    chunks = sorted(
+        (kwargs["data"]["id"].split(",") for _, _, kwargs in session.sent),
+        key=lambda ids: int(ids[0]),
+    )
+    assert chunks == [
+        pubmed_ids[i : i + fetcher.EFETCH_CHUNK_SIZE]
+        for i in range(0, len(pubmed_ids), fetcher.EFETCH_CHUNK_SIZE)
+    ]
+    assert len(chunks) == chunk_count
+    assert {method for method, _, _ in session.sent} == {"POST"}
+
+
+def test_fetch_paper_details_bounds_window(
+    monkeypatch, session, no_rate_limit, submitted
+):
+    pubmed_ids = [str(i) for i in range(fetcher.EFETCH_CHUNK_SIZE * 20)]
+    session.handler = lambda method, url, data, **kwargs: FakeResponse(
+        _efetch_article(data["id"].split(",")[0])
+    )
+    ahead = []
+    parse_chunk = PubMedFetcher._parse_chunk
+
+    def recording_parse_chunk(self, body):
+        # Futures submitted but not yet taken from the window.
+        ahead.append(len(submitted) - len(ahead) - 1)
+        return parse_chunk(self, body)
+
+    monkeypatch.setattr(PubMedFetcher, "_parse_chunk", recording_parse_chunk)
+    papers = PubMedFetcher().fetch_paper_details(pubmed_ids)
+
+    assert len(papers) == 20
+    assert len(submitted) == 20
+    assert max(ahead) == fetcher.MAX_PENDING_CHUNKS
+
+
+def test_fetch_paper_details_cancels_queued_chunks(session, no_rate_limit, submitted):
+    pubmed_ids = [str(i) for i in range(fetcher.EFETCH_CHUNK_SIZE * 20)]
+
+    def handler(method, url, data, **kwargs):
+        ids = data["id"].split(",")
+        if ids[0] == "0":
+            return FakeResponse(b"", 500)
+        time.sleep(0.2)
+        return FakeResponse(_efetch_article(ids[0]))
+
+    session.handler = handler
+    with pytest.raises(requests.HTTPError):
+        PubMedFetcher().fetch_paper_details(pubmed_ids)
+
+    # Nothing is submitted after the failure, and every queued chunk that had
+    # not started downloading is cancelled.
+    assert len(submitted) == fetcher.MAX_PENDING_CHUNKS
+    started = len(session.sent)
+    assert started < fetcher.MAX_PENDING_CHUNKS
+    assert sum(future.cancelled() for future in submitted) == (
+        fetcher.MAX_PENDING_CHUNKS - started
+    )
+
+
+def test_write_csv_pyarrow(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "papers.csv"
+    PubMedFetcher().write_csv(_sample_papers(), str(path), use_pyarrow=True)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == ",".join(f'"{name}"' for name in COLUMNS)
+    assert lines[2] == '"2","Plain","2021","Lee, Kim","Acme Co",""'
+
+
+def test_write_csv_pyarrow_missing(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetcher, "pa", None)
+    with pytest.raises(ImportError):
+        PubMedFetcher().write_csv(
+            _sample_papers(), str(tmp_path / "papers.csv"), use_pyarrow=True
+        )
+
+
+def test_write_csv_ignores_installed_pyarrow_by_default(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "papers.csv"
+    PubMedFetcher().write_csv(_sample_papers(), str(path))
+    assert path.read_text(encoding="utf-8") == EXPECTED_CSV
+
+
+def test_papers_to_csv_tab_delimited():
+    output = io.StringIO()
+    PubMedFetcher().papers_to_csv(_sample_papers(), output, delimiter="\t")
+    lines = output.getvalue().splitlines()
+    assert lines[0] == "\t".join(COLUMNS)
+    assert lines[2] == "2\tPlain\t2021\tLee, Kim\tAcme Co\t"
+
+
+def test_cli_prints_tab_separated_rows(monkeypatch, capsys):
+    monkeypatch.setattr(
+        PubMedFetcher, "fetch_papers", lambda self, query, max_results: _sample_papers()
+    )
+    assert cli.main(["cancer"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "\t".join(COLUMNS)
+    assert len(lines) == 3
+
+
+def test_ascii_lower_keeps_length():
+    assert _parse._ascii_lower("Pfizer INC") == "pfizer inc"
+    assert _parse._ascii_lower("İSTANBUL Pharma") == "İstanbul pharma"
+
+
+@pytest.mark.parametrize(
+    "affiliation, company",
+    [
+        ("İstanbul Pharma Co", "İstanbul Pharma Co"),
+        # Full str.lower() would lengthen each "İ" and shift the clause.
+        ("DİVİZYON İLAÇ İŞLERİ, Acme Co, Ankara", "Acme Co"),
+    ],
+)
+def test_classify_non_ascii_offsets(keyword_mode, affiliation, company):
+    assert _parse.classify(affiliation) == (None, True, company)
+
+
+@pytest.mark.parametrize("decoder", ["json", "orjson"])
+def test_search_papers_json_decoders(monkeypatch, session, no_rate_limit, decoder):
+    json_module = json if decoder == "json" else pytest.importorskip("orjson")
+    monkeypatch.setattr(fetcher, "json_loads", json_module.loads)
+    # Raw UTF-8 bytes, as NCBI sends them.
+    body = '{"esearchresult": {"idlist": ["1", "2"], "querytranslation": "é"}}'
+    session.handler = lambda method, url, **kwargs: FakeResponse(body.encode())
+    assert PubMedFetcher().search_papers("cancer") == ["1", "2"]
+
+
+MEDLINE_RECORDS = "\n\n".join(
+    [
+        """PMID- 111
+TI  - A long title that
+      continues here.
+DP  - 2023 Mar 15
+FAU - Smith, Jane
+AU  - Smith J
+AD  - Department of Biology, Harvard University, Boston.
+FAU - Doe, John
+AU  - Doe J
+AD  - Pfizer Inc, New York,
+      NY, USA.
+AD  - Second affiliation line.
+CN  - Acme Therapeutics Consortium
+AD  - Acme Therapeutics, Basel.""",
+        """TI  - No identifier
+FAU - Roe, Ann
+AD  - Novartis AG, Basel.""",
+        """PMID- 333
+TI  - Academic only
+FAU - Lee, Kim
+AD  - University of Oxford.""",
+    ]
+)
+
+
+def test_medline_records():
+    papers = PubMedFetcher(medline=True)._parse_chunk(MEDLINE_RECORDS.encode())
+
+    # The record without a PMID and the academic-only record are dropped.
+    assert [paper.pubmed_id for paper in papers] == ["111"]
+    paper = papers[0]
+    assert paper.title == "A long title that continues here."
+    assert paper.publication_date == "2023-Mar-15"
+    assert paper.has_non_academic
+
+    smith, doe, acme = paper.authors
+    assert smith.name == "Smith, Jane"
+    assert not smith.is_non_academic
+    assert doe.name == "Doe, John"
+    assert doe.affiliation == "Pfizer Inc, New York, NY, USA.; Second affiliation line."
+    assert doe.is_non_academic
+    assert doe.company == "Pfizer Inc"
+    assert acme.name == "Acme Therapeutics Consortium"
+    assert acme.affiliation == "Acme Therapeutics, Basel."
+    assert acme.company == "Acme Therapeutics"
+    assert paper.corresponding_author_email is None
+
+
+def test_medline_year_only_date():
+    record = "PMID- 5\nDP  - 2019\nFAU - Doe, John\nAD  - Pfizer Inc."
+    papers = PubMedFetcher(medline=True)._parse_chunk(record.encode())
+    assert papers[0].publication_date == "2019"
+
+
+def test_medline_efetch_request(session, no_rate_limit):
+    record = "PMID- 5\nFAU - Doe, John\nAD  - Pfizer Inc."
+    session.handler = lambda method, url, **kwargs: FakeResponse(record.encode())
+    papers = PubMedFetcher(medline=True).fetch_paper_details(["5"])
+
+    assert [paper.pubmed_id for paper in papers] == ["5"]
+    ((_, _, kwargs),) = session.sent
+    assert kwargs["data"]["rettype"] == "medline"
+    assert kwargs["data"]["retmode"] == "text"